@@ -0,0 +1,80 @@
+// Generated by using Rcpp::compileAttributes() -> do not edit by hand
+// Generator token: 10BE3573-1514-4C36-9D1C-5A225CD40393
+
+#include <Rcpp.h>
+
+using namespace Rcpp;
+
+#ifdef RCPP_USE_GLOBAL_ROSTREAM
+Rcpp::Rostream<true>&  Rcpp::Rcout = Rcpp::Rcpp_cout_get();
+Rcpp::Rostream<false>& Rcpp::Rcerr = Rcpp::Rcpp_cerr_get();
+#endif
+
+// exact_rf_pmf
+NumericVector exact_rf_pmf(IntegerMatrix edge, int n_tips);
+RcppExport SEXP _manticore_exact_rf_pmf(SEXP edgeSEXP, SEXP n_tipsSEXP) {
+BEGIN_RCPP
+    Rcpp::RObject rcpp_result_gen;
+    Rcpp::RNGScope rcpp_rngScope_gen;
+    Rcpp::traits::input_parameter< IntegerMatrix >::type edge(edgeSEXP);
+    Rcpp::traits::input_parameter< int >::type n_tips(n_tipsSEXP);
+    rcpp_result_gen = Rcpp::wrap(exact_rf_pmf(edge, n_tips));
+    return rcpp_result_gen;
+END_RCPP
+}
+// native_null_block
+NumericMatrix native_null_block(RawMatrix ref_splits, int n_tips, int n_draws, IntegerVector metrics);
+RcppExport SEXP _manticore_native_null_block(SEXP ref_splitsSEXP, SEXP n_tipsSEXP, SEXP n_drawsSEXP, SEXP metricsSEXP) {
+BEGIN_RCPP
+    Rcpp::RObject rcpp_result_gen;
+    Rcpp::RNGScope rcpp_rngScope_gen;
+    Rcpp::traits::input_parameter< RawMatrix >::type ref_splits(ref_splitsSEXP);
+    Rcpp::traits::input_parameter< int >::type n_tips(n_tipsSEXP);
+    Rcpp::traits::input_parameter< int >::type n_draws(n_drawsSEXP);
+    Rcpp::traits::input_parameter< IntegerVector >::type metrics(metricsSEXP);
+    rcpp_result_gen = Rcpp::wrap(native_null_block(ref_splits, n_tips, n_draws, metrics));
+    return rcpp_result_gen;
+END_RCPP
+}
+// native_permutation_block
+NumericMatrix native_permutation_block(RawMatrix ref_splits, RawMatrix query_splits, int n_tips, int n_draws, IntegerVector metrics);
+RcppExport SEXP _manticore_native_permutation_block(SEXP ref_splitsSEXP, SEXP query_splitsSEXP, SEXP n_tipsSEXP, SEXP n_drawsSEXP, SEXP metricsSEXP) {
+BEGIN_RCPP
+    Rcpp::RObject rcpp_result_gen;
+    Rcpp::RNGScope rcpp_rngScope_gen;
+    Rcpp::traits::input_parameter< RawMatrix >::type ref_splits(ref_splitsSEXP);
+    Rcpp::traits::input_parameter< RawMatrix >::type query_splits(query_splitsSEXP);
+    Rcpp::traits::input_parameter< int >::type n_tips(n_tipsSEXP);
+    Rcpp::traits::input_parameter< int >::type n_draws(n_drawsSEXP);
+    Rcpp::traits::input_parameter< IntegerVector >::type metrics(metricsSEXP);
+    rcpp_result_gen = Rcpp::wrap(native_permutation_block(ref_splits, query_splits, n_tips, n_draws, metrics));
+    return rcpp_result_gen;
+END_RCPP
+}
+// native_split_distance
+NumericVector native_split_distance(RawMatrix ref_splits, RawMatrix query_splits, int n_tips, IntegerVector metrics);
+RcppExport SEXP _manticore_native_split_distance(SEXP ref_splitsSEXP, SEXP query_splitsSEXP, SEXP n_tipsSEXP, SEXP metricsSEXP) {
+BEGIN_RCPP
+    Rcpp::RObject rcpp_result_gen;
+    Rcpp::RNGScope rcpp_rngScope_gen;
+    Rcpp::traits::input_parameter< RawMatrix >::type ref_splits(ref_splitsSEXP);
+    Rcpp::traits::input_parameter< RawMatrix >::type query_splits(query_splitsSEXP);
+    Rcpp::traits::input_parameter< int >::type n_tips(n_tipsSEXP);
+    Rcpp::traits::input_parameter< IntegerVector >::type metrics(metricsSEXP);
+    rcpp_result_gen = Rcpp::wrap(native_split_distance(ref_splits, query_splits, n_tips, metrics));
+    return rcpp_result_gen;
+END_RCPP
+}
+
+static const R_CallMethodDef CallEntries[] = {
+    {"_manticore_exact_rf_pmf", (DL_FUNC) &_manticore_exact_rf_pmf, 2},
+    {"_manticore_native_null_block", (DL_FUNC) &_manticore_native_null_block, 4},
+    {"_manticore_native_permutation_block", (DL_FUNC) &_manticore_native_permutation_block, 5},
+    {"_manticore_native_split_distance", (DL_FUNC) &_manticore_native_split_distance, 4},
+    {NULL, NULL, 0}
+};
+
+RcppExport void R_init_manticore(DllInfo *dll) {
+    R_registerRoutines(dll, NULL, CallEntries, NULL, NULL);
+    R_useDynamicSymbols(dll, FALSE);
+}
@@ -0,0 +1,145 @@
+#include <Rcpp.h>
+#include <cmath>
+#include <vector>
+using namespace Rcpp;
+
+typedef std::vector<std::vector<long double> > Table;
+
+// log of (2e - 1)!!, the number of unrooted binary trees on e + 2 tips
+static long double log_double_factorial(int e) {
+  if (e <= 0) return 0.0L;
+  return std::lgamma((long double) (2 * e + 1)) - e * std::log(2.0L) -
+    std::lgamma((long double) (e + 1));
+}
+
+// Exact distribution of the number of reference splits shared with a
+// uniformly random unrooted binary tree.
+//
+// Each set A of internal reference edges corresponds to the forest obtained
+// by contracting the other internal edges. The number of binary trees that
+// contain every split in A is the product, over the vertices of that forest,
+// of (2d - 5)!! where d is the vertex degree, i.e. (2e - 1)!! with excess
+// e = d - 2. A dynamic programme over the internal nodes of the reference
+// accumulates these counts by |A|, giving the factorial moments
+// E[choose(X, k)], which are then inverted to P(X = j). Counts are scaled by
+// R^e with R^(n - 2) = (2n - 5)!!, so every complete product is a probability.
+//
+// edge: edge matrix of the unrooted reference (1-based node numbers)
+// Returns P(X = j) for j = 0, ..., number of internal edges
+// [[Rcpp::export]]
+NumericVector exact_rf_pmf(IntegerMatrix edge, int n_tips) {
+  const int n_edges = edge.nrow();
+  int n_nodes = n_tips;
+  for (int i = 0; i < n_edges; ++i) {
+    n_nodes = std::max(n_nodes, std::max(edge(i, 0), edge(i, 1)));
+  }
+  if (n_tips < 4 || n_nodes == n_tips) {
+    return NumericVector::create(1.0);
+  }
+
+  // degree of every node and adjacency between internal nodes
+  std::vector<int> degree(n_nodes + 1, 0);
+  std::vector<std::vector<int> > adjacent(n_nodes + 1);
+  int n_internal_edges = 0;
+  for (int i = 0; i < n_edges; ++i) {
+    const int a = edge(i, 0), b = edge(i, 1);
+    ++degree[a];
+    ++degree[b];
+    if (a > n_tips && b > n_tips) {
+      adjacent[a].push_back(b);
+      adjacent[b].push_back(a);
+      ++n_internal_edges;
+    }
+  }
+
+  // scaled weight of a closed component with excess e
+  const long double log_scale = log_double_factorial(n_tips - 2) / (n_tips - 2);
+  std::vector<long double> weight(n_tips - 1);
+  for (int e = 0; e < n_tips - 1; ++e) {
+    weight[e] = std::exp(log_double_factorial(e) - e * log_scale);
+  }
+
+  // order internal nodes so that children come after their parent
+  const int root = n_tips + 1;
+  std::vector<int> order(1, root), parent(n_nodes + 1, 0);
+  parent[root] = -1;
+  for (size_t i = 0; i < order.size(); ++i) {
+    const int v = order[i];
+    for (size_t c = 0; c < adjacent[v].size(); ++c) {
+      const int u = adjacent[v][c];
+      if (u != parent[v]) {
+        parent[u] = v;
+        order.push_back(u);
+      }
+    }
+  }
+
+  // table[v][e][k]: summed weight of closed components in the subtree of v,
+  // with k chosen edges and excess e in the component containing v
+  std::vector<Table> table(n_nodes + 1);
+  for (int i = order.size() - 1; i >= 0; --i) {
+    const int v = order[i];
+    Table current(degree[v] - 1, std::vector<long double>(1, 0.0L));
+    current[degree[v] - 2][0] = 1.0L;
+    for (size_t c = 0; c < adjacent[v].size(); ++c) {
+      const int u = adjacent[v][c];
+      if (u == parent[v]) continue;
+      const Table &child = table[u];
+      const int e1_size = current.size(), k1_size = current[0].size();
+      const int e2_size = child.size(), k2_size = child[0].size();
+
+      // weight of the child subtree when its edge to v is chosen
+      std::vector<long double> closed(k2_size, 0.0L);
+      for (int e2 = 0; e2 < e2_size; ++e2) {
+        for (int k2 = 0; k2 < k2_size; ++k2) {
+          closed[k2] += child[e2][k2] * weight[e2];
+        }
+      }
+
+      Table merged(e1_size + e2_size - 1, std::vector<long double>(k1_size + k2_size, 0.0L));
+      for (int e1 = 0; e1 < e1_size; ++e1) {
+        for (int k1 = 0; k1 < k1_size; ++k1) {
+          const long double x = current[e1][k1];
+          if (x == 0.0L) continue;
+          // edge chosen: child component is closed
+          for (int k2 = 0; k2 < k2_size; ++k2) {
+            merged[e1][k1 + k2 + 1] += x * closed[k2];
+          }
+          // edge contracted: child component joins the component of v
+          for (int e2 = 0; e2 < e2_size; ++e2) {
+            for (int k2 = 0; k2 < k2_size; ++k2) {
+              merged[e1 + e2][k1 + k2] += x * child[e2][k2];
+            }
+          }
+        }
+      }
+      current.swap(merged);
+      Table().swap(table[u]);
+    }
+    table[v].swap(current);
+  }
+
+  // factorial moments E[choose(X, k)]
+  const Table &final_table = table[root];
+  std::vector<long double> moments(n_internal_edges + 1, 0.0L);
+  for (size_t e = 0; e < final_table.size(); ++e) {
+    for (size_t k = 0; k < final_table[e].size() && k <= (size_t) n_internal_edges; ++k) {
+      moments[k] += final_table[e][k] * weight[e];
+    }
+  }
+
+  // invert moments: P(X = j) = sum over k >= j of (-1)^(k - j) choose(k, j) E[choose(X, k)]
+  NumericVector pmf(n_internal_edges + 1);
+  for (int j = 0; j <= n_internal_edges; ++j) {
+    long double p = 0.0L;
+    for (int k = j; k <= n_internal_edges; ++k) {
+      const long double log_choose = std::lgamma((long double) (k + 1)) -
+        std::lgamma((long double) (j + 1)) - std::lgamma((long double) (k - j + 1));
+      const long double term = std::exp(log_choose) * moments[k];
+      p += ((k - j) % 2 == 0) ? term : -term;
+    }
+    // clamp rounding error in the far tail
+    pmf[j] = p > 0.0L ? (double) p : 0.0;
+  }
+  return pmf;
+}
@@ -0,0 +1,255 @@
+#include <Rcpp.h>
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <vector>
+using namespace Rcpp;
+
+// Metric codes shared with R/native_engine.R
+const int METRIC_RF = 0;
+const int METRIC_ICRF = 1;
+
+typedef std::vector<uint64_t> Bitset;
+
+// log2 of (2m - 1)!!
+static double log2_double_factorial(int m) {
+  if (m <= 0) return 0.0;
+  return (std::lgamma(2.0 * m + 1.0) - m * std::log(2.0) - std::lgamma(m + 1.0)) /
+    std::log(2.0);
+}
+
+// Phylogenetic information content (bits) of a split with a tips on one side
+static double split_info(int a, int n_tips) {
+  int b = n_tips - a;
+  return log2_double_factorial(n_tips - 2) -
+    log2_double_factorial(a - 1) - log2_double_factorial(b - 1);
+}
+
+// Orient a split away from tip 0, clearing bits beyond the last tip
+static void orient_split(Bitset &split, int n_tips) {
+  const int n_words = split.size();
+  if (split[0] & 1ULL) {
+    for (int w = 0; w < n_words; ++w) split[w] = ~split[w];
+  }
+  const int spare = n_words * 64 - n_tips;
+  if (spare > 0) split[n_words - 1] &= (~0ULL) >> spare;
+}
+
+static int split_size(const Bitset &split) {
+  int size = 0;
+  for (size_t w = 0; w < split.size(); ++w) {
+    uint64_t word = split[w];
+    while (word) {
+      word &= word - 1;
+      ++size;
+    }
+  }
+  return size;
+}
+
+// Unpack a TreeTools Splits raw matrix into sorted, oriented bitsets
+static std::vector<Bitset> unpack_splits(const RawMatrix &splits, int n_tips) {
+  const int n_splits = splits.nrow();
+  const int n_bytes = splits.ncol();
+  const int n_words = (n_tips + 63) / 64;
+  std::vector<Bitset> unpacked(n_splits, Bitset(n_words, 0));
+  for (int i = 0; i < n_splits; ++i) {
+    for (int byte = 0; byte < n_bytes; ++byte) {
+      unpacked[i][byte / 8] |= uint64_t(splits(i, byte)) << (8 * (byte % 8));
+    }
+    orient_split(unpacked[i], n_tips);
+  }
+  std::sort(unpacked.begin(), unpacked.end());
+  return unpacked;
+}
+
+// Reference splits and their information content
+struct Reference {
+  int n_tips;
+  std::vector<Bitset> splits;
+  double info;
+};
+
+static Reference make_reference(const RawMatrix &ref_splits, int n_tips) {
+  Reference reference;
+  reference.n_tips = n_tips;
+  reference.splits = unpack_splits(ref_splits, n_tips);
+  reference.info = 0.0;
+  for (size_t i = 0; i < reference.splits.size(); ++i) {
+    reference.info += split_info(split_size(reference.splits[i]), n_tips);
+  }
+  return reference;
+}
+
+// Score a set of oriented splits against the reference
+static double score_splits(const Reference &reference, const std::vector<Bitset> &splits,
+                           int metric) {
+  const int n_tips = reference.n_tips;
+  int shared = 0;
+  double shared_info = 0.0, info = 0.0;
+  for (size_t i = 0; i < splits.size(); ++i) {
+    const double this_info = split_info(split_size(splits[i]), n_tips);
+    info += this_info;
+    if (std::binary_search(reference.splits.begin(), reference.splits.end(), splits[i])) {
+      ++shared;
+      shared_info += this_info;
+    }
+  }
+  if (metric == METRIC_RF) {
+    return double(reference.splits.size() + splits.size()) - 2.0 * shared;
+  }
+  return reference.info + info - 2.0 * shared_info;
+}
+
+// Draw a uniformly random unrooted binary topology and return its splits
+// Tips are added one at a time onto a uniformly chosen edge, which gives
+// every labelled unrooted topology the same probability. The tree is held
+// rooted on tip 0, so every clade is already oriented away from tip 0.
+static std::vector<Bitset> random_topology_splits(int n_tips) {
+  std::vector<Bitset> splits;
+  if (n_tips < 4) return splits;
+  const int n_nodes = 2 * n_tips - 2;
+  const int n_words = (n_tips + 63) / 64;
+  std::vector<int> parent(n_nodes, -1);
+  std::vector<int> edges;
+  edges.reserve(2 * n_tips - 3);
+
+  // three tip star: internal node n_tips below tip 0
+  int next_node = n_tips;
+  parent[next_node] = 0;
+  parent[1] = next_node;
+  parent[2] = next_node;
+  edges.push_back(next_node);
+  edges.push_back(1);
+  edges.push_back(2);
+  ++next_node;
+
+  // insert each further tip on a random edge (identified by its child node)
+  for (int tip = 3; tip < n_tips; ++tip) {
+    int edge = int(R::unif_rand() * edges.size());
+    if (edge >= int(edges.size())) edge = edges.size() - 1;
+    const int child = edges[edge];
+    const int node = next_node++;
+    parent[node] = parent[child];
+    parent[child] = node;
+    parent[tip] = node;
+    edges.push_back(node);
+    edges.push_back(tip);
+  }
+
+  // collect children of each internal node
+  std::vector<int> first_child(n_nodes, -1), second_child(n_nodes, -1);
+  int top = -1;
+  for (int node = 1; node < n_nodes; ++node) {
+    const int p = parent[node];
+    if (p == 0) {
+      top = node;
+    } else if (first_child[p] < 0) {
+      first_child[p] = node;
+    } else {
+      second_child[p] = node;
+    }
+  }
+
+  // post-order traversal from the node below tip 0
+  std::vector<Bitset> clades(n_nodes - n_tips, Bitset(n_words, 0));
+  std::vector<int> stack, order;
+  stack.push_back(top);
+  while (!stack.empty()) {
+    const int node = stack.back();
+    stack.pop_back();
+    order.push_back(node);
+    if (node >= n_tips) {
+      stack.push_back(first_child[node]);
+      stack.push_back(second_child[node]);
+    }
+  }
+  splits.reserve(n_tips - 3);
+  for (int i = order.size() - 1; i >= 0; --i) {
+    const int node = order[i];
+    if (node < n_tips) continue;
+    Bitset &clade = clades[node - n_tips];
+    const int children[2] = {first_child[node], second_child[node]};
+    for (int c = 0; c < 2; ++c) {
+      const int child = children[c];
+      if (child < n_tips) {
+        clade[child / 64] |= 1ULL << (child % 64);
+      } else {
+        const Bitset &child_clade = clades[child - n_tips];
+        for (int w = 0; w < n_words; ++w) clade[w] |= child_clade[w];
+      }
+    }
+    // the clade below tip 0 holds every other tip and is not informative
+    if (node != top) splits.push_back(clade);
+  }
+  return splits;
+}
+
+// [[Rcpp::export]]
+NumericMatrix native_null_block(RawMatrix ref_splits, int n_tips, int n_draws,
+                                IntegerVector metrics) {
+  const Reference reference = make_reference(ref_splits, n_tips);
+  NumericMatrix congruence(n_draws, metrics.size());
+  for (int i = 0; i < n_draws; ++i) {
+    const std::vector<Bitset> splits = random_topology_splits(n_tips);
+    for (int m = 0; m < metrics.size(); ++m) {
+      congruence(i, m) = score_splits(reference, splits, metrics[m]);
+    }
+  }
+  return congruence;
+}
+
+// Relabel splits by a permutation of the tips and orient the result
+static std::vector<Bitset> permute_splits(const std::vector<Bitset> &splits,
+                                          const std::vector<int> &permutation, int n_tips) {
+  const int n_words = (n_tips + 63) / 64;
+  std::vector<Bitset> permuted(splits.size(), Bitset(n_words, 0));
+  for (size_t i = 0; i < splits.size(); ++i) {
+    for (int w = 0; w < n_words; ++w) {
+      uint64_t word = splits[i][w];
+      while (word) {
+        const int tip = 64 * w + __builtin_ctzll(word);
+        word &= word - 1;
+        const int to = permutation[tip];
+        permuted[i][to / 64] |= 1ULL << (to % 64);
+      }
+    }
+    orient_split(permuted[i], n_tips);
+  }
+  return permuted;
+}
+
+// [[Rcpp::export]]
+NumericMatrix native_permutation_block(RawMatrix ref_splits, RawMatrix query_splits, int n_tips,
+                                       int n_draws, IntegerVector metrics) {
+  const Reference reference = make_reference(ref_splits, n_tips);
+  const std::vector<Bitset> splits = unpack_splits(query_splits, n_tips);
+  std::vector<int> permutation(n_tips);
+  for (int tip = 0; tip < n_tips; ++tip) permutation[tip] = tip;
+  NumericMatrix congruence(n_draws, metrics.size());
+  for (int i = 0; i < n_draws; ++i) {
+    // Fisher-Yates shuffle of the tip labels
+    for (int tip = n_tips - 1; tip > 0; --tip) {
+      int other = int(R::unif_rand() * (tip + 1));
+      if (other > tip) other = tip;
+      std::swap(permutation[tip], permutation[other]);
+    }
+    const std::vector<Bitset> permuted = permute_splits(splits, permutation, n_tips);
+    for (int m = 0; m < metrics.size(); ++m) {
+      congruence(i, m) = score_splits(reference, permuted, metrics[m]);
+    }
+  }
+  return congruence;
+}
+
+// [[Rcpp::export]]
+NumericVector native_split_distance(RawMatrix ref_splits, RawMatrix query_splits,
+                                    int n_tips, IntegerVector metrics) {
+  const Reference reference = make_reference(ref_splits, n_tips);
+  const std::vector<Bitset> splits = unpack_splits(query_splits, n_tips);
+  NumericVector congruence(metrics.size());
+  for (int m = 0; m < metrics.size(); ++m) {
+    congruence[m] = score_splits(reference, splits, metrics[m]);
+  }
+  return congruence;
+}